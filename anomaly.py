@@ -0,0 +1,50 @@
+from typing import Tuple
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; the NumPy path gives the same results
+    njit = None
+
+def _rolling_zscore_numpy(prices: np.ndarray, window: int, k: float) -> Tuple[np.ndarray, np.ndarray]:
+    mask = np.zeros(prices.size, dtype=np.bool_)
+    score = np.zeros(prices.size)
+    if prices.size <= window:
+        return mask, score
+    # Window i holds the `window` points before prices[window + i]
+    windows = sliding_window_view(prices[:-1], window)
+    mu = windows.mean(axis=1)
+    sd = windows.std(axis=1)
+    diff = prices[window:] - mu
+    mask[window:] = np.abs(diff) > k * sd
+    np.divide(diff, sd, out=score[window:], where=sd > 0)
+    return mask, score
+
+if njit is not None:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _rolling_zscore_numba(prices, window, k):
+        mask = np.zeros(prices.size, np.bool_)
+        score = np.zeros(prices.size)
+        for i in prange(window, prices.size):
+            w = prices[i - window:i]
+            mu = w.mean()
+            sd = w.std()
+            diff = prices[i] - mu
+            mask[i] = abs(diff) > k * sd
+            if sd > 0:
+                score[i] = diff / sd
+        return mask, score
+
+def rolling_zscore(prices, window: int = 60, k: float = 3.0) -> Tuple[np.ndarray, np.ndarray]:
+    """Flag points more than `k` rolling standard deviations from the trailing `window` mean
+
+    Returns (anomaly mask, z-score) in one pass. Uses a numba kernel when numba is
+    installed; the first call pays its compile time, so the simple peg threshold
+    remains the default detector.
+    """
+    arr = np.ascontiguousarray(prices, dtype=np.float64)
+    if njit is not None:
+        return _rolling_zscore_numba(arr, window, k)
+    return _rolling_zscore_numpy(arr, window, k)
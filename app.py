@@ -1,136 +1,88 @@
 import dash
-from dash import dcc, html, Input, Output, callback
+from dash import dcc, html, Input, Output, State, Patch, callback, ctx, no_update
 import dash_bootstrap_components as dbc
-import plotly.graph_objs as go
+import dash_ag_grid as dag
+from dash_extensions import WebSocket
+from flask_sock import Sock
+import plotly.io as pio
 import plotly.express as px
 from plotly.subplots import make_subplots
-import pandas as pd
-import asyncio
+import numpy as np
+import os
 import threading
 import time
 from datetime import datetime, timedelta
-import json
+import orjson
+from prometheus_client import CollectorRegistry, make_wsgi_app, multiprocess
+from werkzeug.middleware.dispatcher import DispatcherMiddleware
 
+from broadcast import SnapshotBroadcaster
+from collector_daemon import start_in_background
 from data_collectors import DataAggregator
-from config import STABLECOINS, ANOMALY_THRESHOLD
+from config import STABLECOINS, ANOMALY_THRESHOLD, REDIS_URL, WEBSOCKET_URL, ZSCORE_ANOMALIES
+from metrics import timed_callback
+from store import snapshot_store
 
 # Initialize the Dash app
 app = dash.Dash(__name__, external_stylesheets=[dbc.themes.BOOTSTRAP])
 app.title = "Stablecoin Tracker Dashboard"
+server = app.server
 
-# Initialize data aggregator
-data_aggregator = DataAggregator()
+# Serialize figures and callback payloads with orjson
+pio.json.config.default_engine = 'orjson'
 
-# Global data storage
-current_data = {}
-historical_data = {}
+def metrics_app():
+    """Serve this process's metrics, or all workers' when PROMETHEUS_MULTIPROC_DIR is set"""
+    if 'PROMETHEUS_MULTIPROC_DIR' not in os.environ:
+        return make_wsgi_app()
+    registry = CollectorRegistry()
+    multiprocess.MultiProcessCollector(registry)
+    return make_wsgi_app(registry)
 
-def get_fallback_data():
-    """Get fallback data when APIs are not working"""
-    return {
-        'USDT': {
-            'price': 1.00,
-            'market_cap': 100000000000,
-            'change_24h': 0.01,
-            'supply': 100000000000,
-            'holders': 5000000,
-            'peg_deviation': 0.0,
-            'status': 'Stable'
-        },
-        'USDC': {
-            'price': 1.00,
-            'market_cap': 50000000000,
-            'change_24h': -0.01,
-            'supply': 50000000000,
-            'holders': 2000000,
-            'peg_deviation': 0.0,
-            'status': 'Stable'
-        },
-        'DAI': {
-            'price': 0.999,
-            'market_cap': 5000000000,
-            'change_24h': -0.1,
-            'supply': 5000000000,
-            'holders': 1000000,
-            'peg_deviation': -0.1,
-            'status': 'Minor Deviation'
-        }
-    }
+# Prometheus scrape endpoint for collector and callback latencies
+app.server.wsgi_app = DispatcherMiddleware(app.server.wsgi_app, {'/metrics': metrics_app()})
 
-def update_data():
-    """Update data in background thread"""
-    global current_data, historical_data
-    
-    # Initialize with fallback data
-    current_data = get_fallback_data()
-    print("Dashboard initialized with fallback data")
-    
+# Snapshots are pushed to browsers over a WebSocket instead of being polled
+broadcaster = SnapshotBroadcaster()
+sock = Sock(app.server)
+
+def relay_snapshots():
+    """Forward every snapshot written to the store to this worker's WebSocket clients"""
+    epoch = 0
     while True:
         try:
-            print("Attempting to fetch real-time data...")
-            
-            # Collect current data
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            api_data = loop.run_until_complete(data_aggregator.collect_all_data())
-            loop.close()
-            
-            # Use API data if available, otherwise keep fallback
-            if api_data and 'prices' in api_data and api_data['prices']:
-                # Process the API data into the expected format
-                processed_data = {}
-                prices = api_data.get('prices', {})
-                on_chain = api_data.get('on_chain', {})
-                
-                for symbol in STABLECOINS.keys():
-                    symbol_lower = symbol.lower()
-                    price_data = prices.get(symbol_lower, {})
-                    chain_data = on_chain.get(symbol, {})
-                    
-                    if price_data and isinstance(price_data, dict):
-                        price = price_data.get('usd', 1.0)
-                        processed_data[symbol] = {
-                            'price': price,
-                            'market_cap': price_data.get('usd_market_cap', 0),
-                            'change_24h': price_data.get('usd_24h_change', 0),
-                            'supply': chain_data.get('supply', 0),
-                            'holders': chain_data.get('holders', 0),
-                            'peg_deviation': abs(price - 1.0),
-                            'status': 'Stable' if abs(price - 1.0) < 0.01 else 'Minor Deviation'
-                        }
-                        print(f"✅ {symbol}: ${price:.4f}")
-                    else:
-                        # Fallback if data format is unexpected
-                        processed_data[symbol] = get_fallback_data()[symbol]
-                        print(f"⚠️ {symbol}: Using fallback data")
-                
-                current_data = processed_data
-                print("✅ Real-time data updated successfully!")
-            else:
-                print("⚠️ Using fallback data - API not responding")
-            
-            # Collect historical data for each stablecoin (less frequently)
-            for symbol in STABLECOINS.keys():
-                try:
-                    loop = asyncio.new_event_loop()
-                    asyncio.set_event_loop(loop)
-                    hist_data = loop.run_until_complete(data_aggregator.get_historical_data(symbol))
-                    if not hist_data.empty:
-                        historical_data[symbol] = hist_data
-                        print(f"✅ Historical data updated for {symbol}")
-                    loop.close()
-                except Exception as e:
-                    print(f"⚠️ Historical data failed for {symbol}: {e}")
-                
+            latest = snapshot_store.wait_for_update(epoch, timeout=30)
+            if latest > epoch:
+                epoch = latest
+                broadcaster.publish(snapshot_store.get_snapshot())
         except Exception as e:
-            print(f"❌ Error updating data: {e}")
-            # Keep using fallback data
-        
-        time.sleep(60)  # Update every 1 minute for more real-time feel
+            print(f"❌ Error relaying snapshot: {e}")
+            time.sleep(5)
+
+# Without a shared store this process collects its own data
+if not REDIS_URL:
+    start_in_background()
+
+relay_thread = threading.Thread(target=relay_snapshots, daemon=True)
+relay_thread.start()
+
+@sock.route('/ws')
+def push_snapshots(ws):
+    """Send the latest snapshot on connect, then every new one as it is published"""
+    epoch = 0
+    while ws.connected:
+        update = broadcaster.wait(epoch, timeout=30)
+        if update:
+            epoch, payload = update
+            ws.send(payload)
 
-# Start background data update thread
-data_thread = threading.Thread(target=update_data, daemon=True)
-data_thread.start()
+def parse_snapshot(message):
+    """Decode a WebSocket message into a snapshot dict"""
+    if not message or not message.get('data'):
+        return {}
+    return orjson.loads(message['data'])
+
+METRICS_COLUMNS = ['Symbol', 'Price', '24h Change', 'Market Cap', 'Supply', 'Holders']
 
 # App layout
 app.layout = dbc.Container([
@@ -170,7 +122,9 @@ app.layout = dbc.Container([
                         value='USDT',
                         className="mb-3"
                     ),
-                    dcc.Graph(id='price-chart', style={'height': '500px'})
+                    dcc.Graph(id='price-chart', style={'height': '500px'}),
+                    dcc.Store(id='hist-store'),
+                    dcc.Store(id='hist-meta')
                 ])
             ])
         ], width=8),
@@ -204,7 +158,14 @@ app.layout = dbc.Container([
                     html.H5("Detailed Metrics", className="mb-0")
                 ]),
                 dbc.CardBody([
-                    html.Div(id='metrics-table')
+                    dag.AgGrid(
+                        id='metrics-table',
+                        columnDefs=[{'field': column} for column in METRICS_COLUMNS],
+                        rowData=[],
+                        getRowId="params.data.Symbol",
+                        columnSize="sizeToFit",
+                        dashGridOptions={'animateRows': False, 'domLayout': 'autoHeight'}
+                    )
                 ])
             ])
         ])
@@ -217,146 +178,46 @@ app.layout = dbc.Container([
         ])
     ]),
     
-    # Interval component for auto-refresh
-    dcc.Interval(
-        id='interval-component',
-        interval=30000,  # 30 seconds
-        n_intervals=0
-    )
+    # Server push of new snapshots
+    WebSocket(id='ws', url=WEBSOCKET_URL or None)
 ], fluid=True, className="py-4")
 
 # Callbacks
 @app.callback(
     [Output(f"price-{symbol}", "children") for symbol in STABLECOINS.keys()] +
     [Output(f"change-{symbol}", "children") for symbol in STABLECOINS.keys()],
-    [Input('interval-component', 'n_intervals')]
+    [Input('ws', 'message')]
 )
-def update_price_cards(n):
+@timed_callback
+def update_price_cards(message):
     """Update price cards with current data"""
+    derived = parse_snapshot(message).get('derived', {})
     prices = []
     changes = []
     
     for symbol in STABLECOINS.keys():
-        if current_data and 'prices' in current_data and symbol.lower() in current_data['prices']:
-            price_data = current_data['prices'][symbol.lower()]
-            price = price_data.get('usd', 0)
-            change_24h = price_data.get('usd_24h_change', 0)
-            
-            # Color coding based on peg deviation
-            deviation = abs(price - 1.0)
-            if deviation > ANOMALY_THRESHOLD:
-                price_color = "text-danger"
-            elif deviation > 0.005:  # 0.5% deviation
-                price_color = "text-warning"
-            else:
-                price_color = "text-success"
-            
-            prices.append(html.Span(f"${price:.4f}", className=price_color))
-            
-            change_text = f"24h: {change_24h:+.2f}%"
-            change_color = "text-success" if change_24h >= 0 else "text-danger"
-            changes.append(html.Span(change_text, className=change_color))
+        view = derived.get(symbol)
+        if view:
+            prices.append(html.Span(view['price_str'], className=view['color']))
+            changes.append(html.Span(view['change_str'], className=view['change_color']))
         else:
             prices.append("Loading...")
             changes.append("")
     
     return prices + changes
 
-@app.callback(
-    Output('price-chart', 'figure'),
-    [Input('stablecoin-selector', 'value'),
-     Input('interval-component', 'n_intervals')]
-)
-def update_price_chart(selected_stablecoin, n):
-    """Update price chart with historical data and anomaly detection"""
-    if selected_stablecoin not in historical_data or historical_data[selected_stablecoin].empty:
-        return go.Figure().add_annotation(
-            text="No data available",
-            xref="paper", yref="paper",
-            x=0.5, y=0.5, showarrow=False
-        )
-    
-    df = historical_data[selected_stablecoin].copy()
-    
-    # Detect anomalies
-    anomalies = data_aggregator.detect_anomalies(df['price'].tolist(), ANOMALY_THRESHOLD)
-    df['anomaly'] = anomalies
-    
-    # Create subplot for price and volume
+def build_chart_layout(symbol):
+    """Build the two-row price/deviation layout for a stablecoin"""
     fig = make_subplots(
         rows=2, cols=1,
         shared_xaxes=True,
         vertical_spacing=0.1,
-        subplot_titles=(f'{selected_stablecoin} Price Over Time', 'Peg Deviation'),
+        subplot_titles=(f'{symbol} Price Over Time', 'Peg Deviation'),
         row_heights=[0.7, 0.3]
     )
     
-    # Price line
-    fig.add_trace(
-        go.Scatter(
-            x=df['timestamp'],
-            y=df['price'],
-            mode='lines',
-            name='Price',
-            line=dict(color='#1f77b4', width=2)
-        ),
-        row=1, col=1
-    )
-    
-    # Target price line
-    fig.add_trace(
-        go.Scatter(
-            x=df['timestamp'],
-            y=[1.0] * len(df),
-            mode='lines',
-            name='Target ($1.00)',
-            line=dict(color='#ff7f0e', width=2, dash='dash')
-        ),
-        row=1, col=1
-    )
-    
-    # Anomaly points
-    anomaly_df = df[df['anomaly']]
-    if not anomaly_df.empty:
-        fig.add_trace(
-            go.Scatter(
-                x=anomaly_df['timestamp'],
-                y=anomaly_df['price'],
-                mode='markers',
-                name='Anomaly',
-                marker=dict(color='red', size=8, symbol='x')
-            ),
-            row=1, col=1
-        )
-    
-    # Peg deviation
-    deviation = abs(df['price'] - 1.0)
-    fig.add_trace(
-        go.Scatter(
-            x=df['timestamp'],
-            y=deviation * 100,  # Convert to percentage
-            mode='lines',
-            name='Deviation (%)',
-            line=dict(color='#d62728', width=2),
-            fill='tonexty'
-        ),
-        row=2, col=1
-    )
-    
-    # Threshold line
-    fig.add_trace(
-        go.Scatter(
-            x=df['timestamp'],
-            y=[ANOMALY_THRESHOLD * 100] * len(df),
-            mode='lines',
-            name=f'Threshold ({ANOMALY_THRESHOLD*100:.1f}%)',
-            line=dict(color='red', width=2, dash='dot')
-        ),
-        row=2, col=1
-    )
-    
     fig.update_layout(
-        title=f'{selected_stablecoin} Price Analysis',
+        title=f'{symbol} Price Analysis',
         xaxis_title='Date',
         yaxis_title='Price (USD)',
         hovermode='x unified',
@@ -364,129 +225,188 @@ def update_price_chart(selected_stablecoin, n):
         height=500
     )
     
+    # Timestamps are shipped as epoch milliseconds
+    fig.update_xaxes(type='date')
     fig.update_yaxes(title_text="Price (USD)", row=1, col=1)
     fig.update_yaxes(title_text="Deviation (%)", row=2, col=1)
     
-    return fig
+    return fig.to_plotly_json()['layout']
+
+# The layout only depends on the symbol, so build each one once
+CHART_LAYOUTS = {symbol: build_chart_layout(symbol) for symbol in STABLECOINS.keys()}
+
+@app.callback(
+    [Output('hist-store', 'data'),
+     Output('hist-meta', 'data')],
+    [Input('stablecoin-selector', 'value'),
+     Input('ws', 'message')],
+    [State('hist-meta', 'data')]
+)
+@timed_callback
+def update_hist_store(selected_stablecoin, message, meta):
+    """Ship the price series to the browser, or only the points it hasn't seen yet"""
+    ts, prices = snapshot_store.get_history(selected_stablecoin)
+    anomalies = DataAggregator.detect_anomalies(prices, ANOMALY_THRESHOLD)
+    if ZSCORE_ANOMALIES:
+        anomalies |= DataAggregator.detect_zscore_anomalies(prices)[0]
+    # Epoch-ms integers and float32 prices serialize far shorter than ISO strings and float64
+    ts_ms = ts.astype('datetime64[ms]').astype('int64')
+    prices32 = prices.astype(np.float32)
+    new_meta = {
+        'symbol': selected_stablecoin,
+        'last_ts': str(ts[-1]) if len(ts) else None,
+        'last_px': float(prices32[-1]) if len(ts) else None,
+        'n': len(ts)
+    }
+    
+    if (ctx.triggered_id == 'ws' and meta and meta['symbol'] == selected_stablecoin
+            and meta['last_ts'] is not None and len(ts)):
+        last_ts = np.datetime64(meta['last_ts'])
+        new = ts > last_ts
+        # The newest hourly point is revised as the hour goes on
+        i = np.searchsorted(ts, last_ts)
+        revised = (i < len(ts) and ts[i] == last_ts
+                   and float(prices32[i]) != meta.get('last_px'))
+        if not new.any() and not revised:
+            return no_update, no_update
+        
+        patch = Patch()
+        if revised:
+            patch['px'][meta['n'] - 1] = float(prices32[i])
+            patch['anomaly'][meta['n'] - 1] = bool(anomalies[i])
+        if new.any():
+            patch['ts'].extend(list(ts_ms[new]))
+            patch['px'].extend(list(prices32[new]))
+            patch['anomaly'].extend(anomalies[new].tolist())
+        # Drop the points that slid out of the window
+        for _ in range(meta['n'] + int(new.sum()) - len(ts)):
+            del patch['ts'][0]
+            del patch['px'][0]
+            del patch['anomaly'][0]
+        return patch, new_meta
+    
+    return {
+        'layout': CHART_LAYOUTS[selected_stablecoin],
+        'threshold': ANOMALY_THRESHOLD,
+        'ts': ts_ms,
+        'px': prices32,
+        'anomaly': anomalies.tolist()
+    }, new_meta
+
+# The figure, including the peg deviation trace, is derived in the browser
+app.clientside_callback(
+    """
+    function(hist) {
+        if (!hist || !hist.ts.length) {
+            return {data: [], layout: {annotations: [{
+                text: 'No data available', xref: 'paper', yref: 'paper',
+                x: 0.5, y: 0.5, showarrow: false
+            }]}};
+        }
+        const ts = hist.ts, px = hist.px;
+        const anomalyX = [], anomalyY = [];
+        hist.anomaly.forEach((isAnomaly, i) => {
+            if (isAnomaly) { anomalyX.push(ts[i]); anomalyY.push(px[i]); }
+        });
+        const data = [
+            {x: ts, y: px, mode: 'lines', name: 'Price',
+             line: {color: '#1f77b4', width: 2}, xaxis: 'x', yaxis: 'y'},
+            {x: ts, y: ts.map(() => 1.0), mode: 'lines', name: 'Target ($1.00)',
+             line: {color: '#ff7f0e', width: 2, dash: 'dash'}, xaxis: 'x', yaxis: 'y'}
+        ];
+        if (anomalyX.length) {
+            data.push({x: anomalyX, y: anomalyY, mode: 'markers', name: 'Anomaly',
+                       marker: {color: 'red', size: 8, symbol: 'x'}, xaxis: 'x', yaxis: 'y'});
+        }
+        data.push(
+            {x: ts, y: px.map(p => Math.abs(p - 1.0) * 100), mode: 'lines', name: 'Deviation (%)',
+             line: {color: '#d62728', width: 2}, fill: 'tozeroy', xaxis: 'x2', yaxis: 'y2'},
+            {x: ts, y: ts.map(() => hist.threshold * 100), mode: 'lines',
+             name: 'Threshold (' + (hist.threshold * 100).toFixed(1) + '%)',
+             line: {color: 'red', width: 2, dash: 'dot'}, xaxis: 'x2', yaxis: 'y2'}
+        );
+        return {data: data, layout: hist.layout};
+    }
+    """,
+    Output('price-chart', 'figure'),
+    Input('hist-store', 'data')
+)
 
 @app.callback(
     Output('supply-metrics', 'children'),
-    [Input('interval-component', 'n_intervals')]
+    [Input('ws', 'message')]
 )
-def update_supply_metrics(n):
+@timed_callback
+def update_supply_metrics(message):
     """Update supply metrics display"""
-    if not current_data or 'on_chain' not in current_data:
+    derived = parse_snapshot(message).get('derived')
+    if not derived:
         return html.P("Loading supply data...")
     
-    metrics = []
-    for symbol, config in STABLECOINS.items():
-        if symbol in current_data['on_chain']:
-            data = current_data['on_chain'][symbol]
-            supply = data.get('supply', 0)
-            holders = data.get('holders', 0)
-            
-            if supply:
-                supply_formatted = f"{supply:,.0f}"
-            else:
-                supply_formatted = "N/A"
-            
-            if holders:
-                holders_formatted = f"{holders:,}"
-            else:
-                holders_formatted = "N/A"
-            
-            metrics.append(html.Div([
-                html.H6(f"{symbol} Supply", className="text-primary"),
-                html.P(f"Total: {supply_formatted}", className="mb-1"),
-                html.P(f"Holders: {holders_formatted}", className="mb-3 text-muted")
-            ]))
-    
-    return metrics
+    return [
+        html.Div([
+            html.H6(f"{symbol} Supply", className="text-primary"),
+            html.P(f"Total: {derived[symbol]['supply_str']}", className="mb-1"),
+            html.P(f"Holders: {derived[symbol]['holders_str']}", className="mb-3 text-muted")
+        ])
+        for symbol in STABLECOINS.keys() if symbol in derived
+    ]
 
 @app.callback(
     Output('stability-analysis', 'children'),
-    [Input('interval-component', 'n_intervals')]
+    [Input('ws', 'message')]
 )
-def update_stability_analysis(n):
+@timed_callback
+def update_stability_analysis(message):
     """Update stability analysis display"""
-    if not current_data or 'prices' not in current_data:
+    derived = parse_snapshot(message).get('derived')
+    if not derived:
         return html.P("Loading stability data...")
     
-    analysis = []
-    for symbol in STABLECOINS.keys():
-        if symbol.lower() in current_data['prices']:
-            price_data = current_data['prices'][symbol.lower()]
-            price = price_data.get('usd', 0)
-            deviation = abs(price - 1.0)
-            deviation_pct = deviation * 100
-            
-            if deviation > ANOMALY_THRESHOLD:
-                status = "⚠️ Unstable"
-                status_class = "text-danger"
-            elif deviation > 0.005:
-                status = "⚠️ Watch"
-                status_class = "text-warning"
-            else:
-                status = "✅ Stable"
-                status_class = "text-success"
-            
-            analysis.append(html.Div([
-                html.H6(f"{symbol} Status", className="text-primary"),
-                html.P(f"Deviation: {deviation_pct:.3f}%", className="mb-1"),
-                html.P(status, className=f"mb-3 {status_class}")
-            ]))
-    
-    return analysis
+    return [
+        html.Div([
+            html.H6(f"{symbol} Status", className="text-primary"),
+            html.P(f"Deviation: {derived[symbol]['deviation_pct']}", className="mb-1"),
+            html.P(derived[symbol]['status'], className=f"mb-3 {derived[symbol]['color']}")
+        ])
+        for symbol in STABLECOINS.keys() if symbol in derived
+    ]
 
 @app.callback(
-    Output('metrics-table', 'children'),
-    [Input('interval-component', 'n_intervals')]
+    Output('metrics-table', 'rowData'),
+    [Input('ws', 'message')],
+    [State('metrics-table', 'rowData')]
 )
-def update_metrics_table(n):
-    """Update detailed metrics table"""
-    if not current_data:
-        return html.P("Loading metrics...")
-    
-    # Create table data
-    table_data = []
-    for symbol in STABLECOINS.keys():
-        if symbol.lower() in current_data.get('prices', {}):
-            price_data = current_data['prices'][symbol.lower()]
-            on_chain_data = current_data.get('on_chain', {}).get(symbol, {})
-            
-            row = {
-                'Symbol': symbol,
-                'Price': f"${price_data.get('usd', 0):.4f}",
-                '24h Change': f"{price_data.get('usd_24h_change', 0):+.2f}%",
-                'Market Cap': f"${price_data.get('usd_market_cap', 0):,.0f}",
-                'Supply': f"{on_chain_data.get('supply', 0):,.0f}" if on_chain_data.get('supply') else "N/A",
-                'Holders': f"{on_chain_data.get('holders', 0):,}" if on_chain_data.get('holders') else "N/A"
-            }
-            table_data.append(row)
+@timed_callback
+def update_metrics_table(message, current_rows):
+    """Update detailed metrics table, sending only the cells that changed"""
+    derived = parse_snapshot(message).get('derived')
+    if not derived:
+        return no_update
     
-    if not table_data:
-        return html.P("No data available")
-    
-    # Create table
-    df = pd.DataFrame(table_data)
-    table = dbc.Table.from_dataframe(
-        df, 
-        striped=True, 
-        bordered=True, 
-        hover=True,
-        className="table-sm"
-    )
+    rows = [derived[symbol]['row'] for symbol in STABLECOINS.keys() if symbol in derived]
+    if not current_rows or [r['Symbol'] for r in current_rows] != [r['Symbol'] for r in rows]:
+        return rows
     
-    return table
+    patch = Patch()
+    changed = False
+    for i, (old, new) in enumerate(zip(current_rows, rows)):
+        for column in METRICS_COLUMNS:
+            if old.get(column) != new[column]:
+                patch[i][column] = new[column]
+                changed = True
+    return patch if changed else no_update
 
 @app.callback(
     Output('last-updated', 'children'),
-    [Input('interval-component', 'n_intervals')]
+    [Input('ws', 'message')]
 )
-def update_last_updated(n):
+@timed_callback
+def update_last_updated(message):
     """Update last updated timestamp"""
-    if current_data and 'timestamp' in current_data:
-        timestamp = current_data['timestamp']
+    snapshot = parse_snapshot(message)
+    if snapshot and 'timestamp' in snapshot:
+        timestamp = snapshot['timestamp']
         try:
             dt = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
             formatted_time = dt.strftime('%Y-%m-%d %H:%M:%S UTC')
@@ -0,0 +1,53 @@
+import time
+from contextlib import asynccontextmanager
+from typing import Optional
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a provider whose circuit is open"""
+
+class CircuitBreaker:
+    """Fails fast after `fail_max` consecutive failures until `reset_timeout` seconds pass
+
+    Once the cooldown is over a single call is let through as a trial, and any
+    concurrent callers keep failing fast: success closes the circuit again,
+    failure re-opens it for another cooldown.
+    """
+
+    def __init__(self, name: str, fail_max: int = 3, reset_timeout: float = 60):
+        self.name = name
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self.fail_counter = 0
+        self.opened_at: Optional[float] = None
+        self._trial_running = False
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return 'closed'
+        if time.monotonic() - self.opened_at < self.reset_timeout:
+            return 'open'
+        return 'half-open'
+
+    @asynccontextmanager
+    async def calling(self):
+        """Guard one call, counting any exception it raises as a failure"""
+        state = self.state
+        if state == 'open' or (state == 'half-open' and self._trial_running):
+            raise CircuitOpenError(f"{self.name} circuit is open")
+        trial = state == 'half-open'
+        if trial:
+            self._trial_running = True
+        try:
+            yield
+        except Exception:
+            self.fail_counter += 1
+            if self.opened_at is not None or self.fail_counter >= self.fail_max:
+                self.opened_at = time.monotonic()
+            raise
+        else:
+            self.fail_counter = 0
+            self.opened_at = None
+        finally:
+            if trial:
+                self._trial_running = False
@@ -0,0 +1,36 @@
+import threading
+from typing import Optional, Tuple
+
+
+class SnapshotBroadcaster:
+    """Holds the latest dashboard snapshot and wakes WebSocket clients when it changes
+
+    Every publish bumps an epoch counter. Clients remember the last epoch they
+    sent, so a late-joining client (epoch 0) gets the buffered snapshot straight
+    away and slow clients simply skip to the newest one.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._epoch = 0
+        self._payload: Optional[str] = None
+
+    @property
+    def epoch(self) -> int:
+        return self._epoch
+
+    def publish(self, payload: str) -> int:
+        """Store a new serialized snapshot and notify all waiting clients"""
+        with self._cond:
+            self._epoch += 1
+            self._payload = payload
+            self._cond.notify_all()
+            return self._epoch
+
+    def wait(self, after_epoch: int, timeout: Optional[float] = None) -> Optional[Tuple[int, str]]:
+        """Block until a snapshot newer than `after_epoch` exists, or timeout"""
+        with self._cond:
+            self._cond.wait_for(lambda: self._epoch > after_epoch, timeout=timeout)
+            if self._epoch > after_epoch:
+                return self._epoch, self._payload
+            return None
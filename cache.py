@@ -0,0 +1,103 @@
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+import orjson
+import redis.asyncio as aioredis
+
+from breaker import CircuitBreaker
+from config import REDIS_URL, CACHE_LAST_GOOD_TTL
+
+logger = logging.getLogger(__name__)
+
+class MemoryCache:
+    """In-process TTL cache used when no Redis server is configured"""
+
+    def __init__(self):
+        self._entries: Dict[str, Tuple[float, bytes]] = {}
+
+    async def get(self, key: str) -> Optional[bytes]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at < time.monotonic():
+            del self._entries[key]
+            return None
+        return value
+
+    async def set(self, key: str, value: bytes, ttl: int):
+        self._entries[key] = (time.monotonic() + ttl, value)
+
+class RedisCache:
+    """Redis-backed TTL cache shared by every app replica"""
+
+    def __init__(self, url: str):
+        self.url = url
+        self._client = None
+        self._loop = None
+
+    def _get_client(self) -> aioredis.Redis:
+        # Connections are bound to the event loop that opened them
+        loop = asyncio.get_running_loop()
+        if self._client is None or self._loop is not loop:
+            self._client = aioredis.Redis.from_url(self.url)
+            self._loop = loop
+        return self._client
+
+    async def get(self, key: str) -> Optional[bytes]:
+        return await self._get_client().get(key)
+
+    async def set(self, key: str, value: bytes, ttl: int):
+        await self._get_client().set(key, value, ex=ttl)
+
+class ResponseCache:
+    """Caches JSON-serializable API results under per-endpoint TTLs"""
+
+    def __init__(self, url: str = REDIS_URL):
+        self.backend = RedisCache(url) if url else MemoryCache()
+
+    async def _read(self, key: str) -> Any:
+        try:
+            cached = await self.backend.get(key)
+            if cached is not None:
+                return orjson.loads(cached)
+        except Exception as e:
+            logger.error(f"Cache read failed for {key}: {e}")
+        return None
+
+    async def get_or_set(self, key: str, ttl: int, factory: Callable[[], Awaitable[Any]],
+                         breaker: Optional[CircuitBreaker] = None) -> Any:
+        """Return the cached value for `key`, awaiting `factory()` to fill it on a miss.
+
+        Empty results are not cached so a failed request is retried on the next cycle.
+        While `breaker` is open the factory fails fast, so the last good value (kept for
+        CACHE_LAST_GOOD_TTL) is returned instead; callers should treat it as stale.
+        """
+        cached = await self._read(key)
+        if cached is not None:
+            return cached
+
+        value = await factory()
+
+        if value:
+            try:
+                payload = orjson.dumps(value)
+                await self.backend.set(key, payload, ttl)
+                await self.backend.set(f"{key}:last_good", payload, CACHE_LAST_GOOD_TTL)
+            except Exception as e:
+                logger.error(f"Cache write failed for {key}: {e}")
+            return value
+
+        if breaker is not None and breaker.state == 'open':
+            last_good = await self.get_last_good(key)
+            if last_good is not None:
+                return last_good
+        return value
+
+    async def get_last_good(self, key: str) -> Any:
+        """Return the last successful value stored under `key`, or None"""
+        return await self._read(f"{key}:last_good")
+
+response_cache = ResponseCache()
@@ -7,6 +7,8 @@ load_dotenv()
 COINGECKO_API_KEY = os.getenv('COINGECKO_API_KEY', '')
 DEFILLAMA_API_KEY = os.getenv('DEFILLAMA_API_KEY', '')
 ETHERSCAN_API_KEY = os.getenv('ETHERSCAN_API_KEY', '')
+# tokenholdercount needs an Etherscan API Pro plan
+ETHERSCAN_PRO = os.getenv('ETHERSCAN_PRO', '').lower() in ('1', 'true', 'yes')
 
 # Stablecoin Configuration
 STABLECOINS = {
@@ -15,21 +17,24 @@ STABLECOINS = {
         'name': 'Tether',
         'address': '0xdAC17F958D2ee523a2206206994597C13D831ec7',  # Ethereum USDT
         'target_price': 1.0,
-        'decimals': 6
+        'decimals': 6,
+        'holders_estimate': 5000000  # used without an Etherscan Pro key
     },
     'USDC': {
         'symbol': 'USDC',
         'name': 'USD Coin',
         'address': '0xA0b86a33E6441b8c4C8C8C8C8C8C8C8C8C8C8C8',  # Ethereum USDC
         'target_price': 1.0,
-        'decimals': 6
+        'decimals': 6,
+        'holders_estimate': 2000000  # used without an Etherscan Pro key
     },
     'DAI': {
         'symbol': 'DAI',
         'name': 'Dai',
         'address': '0x6B175474E89094C44Da98b954EedeAC495271d0F',  # Ethereum DAI
         'target_price': 1.0,
-        'decimals': 18
+        'decimals': 18,
+        'holders_estimate': 1000000  # used without an Etherscan Pro key
     }
 }
 
@@ -38,7 +43,31 @@ COINGECKO_BASE_URL = 'https://api.coingecko.com/api/v3'
 DEFILLAMA_BASE_URL = 'https://api.llama.fi'
 ETHERSCAN_BASE_URL = 'https://api.etherscan.io/api'
 
+# Response cache (in-process when REDIS_URL is empty)
+REDIS_URL = os.getenv('REDIS_URL', '')
+CACHE_TTLS = {
+    'price': 60,          # 1 minute
+    'historical': 3600,   # 1 hour
+    'supply': 600,        # 10 minutes
+    'holders': 3600       # 1 hour
+}
+# How long the last successful response is served while a provider is failing
+CACHE_LAST_GOOD_TTL = 86400  # 1 day
+
+# Historical prices are persisted here so each refresh only downloads new points
+HISTORY_DB_PATH = os.getenv('HISTORY_DB_PATH', 'data/history.duckdb')
+
 # Dashboard Configuration
 REFRESH_INTERVAL = 300  # 5 minutes
 ANOMALY_THRESHOLD = 0.02  # 2% deviation from peg
+ZSCORE_WINDOW = 60  # points in the rolling z-score window
+ZSCORE_K = 3.0  # standard deviations that count as an anomaly
+# Also flag rolling z-score outliers on the chart (first use pays numba's compile time)
+ZSCORE_ANOMALIES = os.getenv('ZSCORE_ANOMALIES', '').lower() in ('1', 'true', 'yes')
 CHART_HISTORY_DAYS = 30
+
+# Port for the standalone collector's Prometheus metrics (the dashboard serves /metrics itself)
+METRICS_PORT = int(os.getenv('METRICS_PORT', '9100'))
+
+# WebSocket endpoint for pushed updates (defaults to ws://<host>/ws when empty)
+WEBSOCKET_URL = os.getenv('WEBSOCKET_URL', '')
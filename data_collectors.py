@@ -1,185 +1,358 @@
 import asyncio
 import aiohttp
-import requests
+import httpx
+import numpy as np
+import orjson
 import pandas as pd
 from datetime import datetime, timedelta
 import time
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple, Union
 import logging
 from asyncio_throttle import Throttler
+from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
 
+from breaker import CircuitBreaker
+from cache import response_cache
+from history import HistorySeries
+from history_db import PriceHistoryDB, open_history_db
+from metrics import COLLECTOR_LATENCY, timed
 from config import (
     COINGECKO_BASE_URL, DEFILLAMA_BASE_URL, ETHERSCAN_BASE_URL,
-    STABLECOINS, COINGECKO_API_KEY, ETHERSCAN_API_KEY
+    STABLECOINS, COINGECKO_API_KEY, ETHERSCAN_API_KEY, ETHERSCAN_PRO, CACHE_TTLS,
+    ZSCORE_WINDOW, ZSCORE_K
 )
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
+# httpx logs every request at INFO
+logging.getLogger("httpx").setLevel(logging.WARNING)
 
-class CoinGeckoCollector:
+class TransientHTTPError(Exception):
+    """A 429 or 5xx response that is worth retrying"""
+
+# Back off and retry when a provider rate-limits us (429) or fails server-side (5xx)
+retry_transient = retry(
+    retry=retry_if_exception_type(TransientHTTPError),
+    wait=wait_exponential(max=30),
+    stop=stop_after_attempt(4),
+    reraise=True
+)
+
+class HTTPCollector:
+    """Base class holding one long-lived aiohttp session per collector
+    
+    Requests go through `_get_json`, which bounds in-flight requests with a
+    semaphore, paces them with a throttler at the provider's rate limit and
+    fails fast through a circuit breaker while the provider is down.
+    """
+    
+    def __init__(self, rate_limit: int = 5, period: float = 1, concurrency: int = 5):
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._sem: Optional[asyncio.Semaphore] = None
+        self.concurrency = concurrency
+        self.throttler = Throttler(rate_limit=rate_limit, period=period)
+        self.breaker = CircuitBreaker(type(self).__name__)
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Create the pooled session on first use and reuse it afterwards"""
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(limit=32, ttl_dns_cache=300),
+                timeout=aiohttp.ClientTimeout(total=10)
+            )
+            # Created with the session so both belong to the same event loop
+            self._sem = asyncio.Semaphore(self.concurrency)
+        return self._session
+    
+    async def _get_json(self, url: str, params: Optional[Dict] = None,
+                        headers: Optional[Dict] = None) -> Tuple[int, Optional[Dict]]:
+        """GET `url` and return (status, decoded body); body is None unless status is 200"""
+        async with self.breaker.calling():
+            return await self._get_json_with_retry(url, params, headers)
+    
+    @retry_transient
+    async def _get_json_with_retry(self, url: str, params: Optional[Dict],
+                                   headers: Optional[Dict]) -> Tuple[int, Optional[Dict]]:
+        await self._get_session()
+        async with self._sem, self.throttler:
+            status, body = await self._fetch(url, params, headers)
+        if status == 429 or status >= 500:
+            raise TransientHTTPError(f"HTTP {status} from {url}")
+        if status != 200:
+            return status, None
+        return status, orjson.loads(body)
+    
+    async def _fetch(self, url: str, params: Optional[Dict],
+                     headers: Optional[Dict]) -> Tuple[int, bytes]:
+        async with self._session.get(url, params=params, headers=headers) as response:
+            return response.status, await response.read()
+    
+    async def close(self):
+        """Close the shared session and its pooled connections"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+class CoinGeckoCollector(HTTPCollector):
     """Collects stablecoin price and market data from CoinGecko API"""
     
     def __init__(self):
+        super().__init__(rate_limit=50, period=60)  # 50 calls per minute
         self.base_url = COINGECKO_BASE_URL
         self.api_key = COINGECKO_API_KEY
-        self.throttler = Throttler(rate_limit=50, period=60)  # 50 calls per minute
+        self.cache = response_cache
+        # Opened on first use so only the process that syncs history locks the file
+        self.history_db: Optional[PriceHistoryDB] = None
+        self._history_db_opened = False
+    
+    async def _get_session(self) -> httpx.AsyncClient:
+        """CoinGecko speaks HTTP/2 and brotli, so its requests share one multiplexed httpx connection"""
+        if self._session is None or self._session.is_closed:
+            self._session = httpx.AsyncClient(
+                http2=True,
+                headers={'accept-encoding': 'br, gzip'},
+                limits=httpx.Limits(max_connections=32, max_keepalive_connections=8),
+                timeout=10.0
+            )
+            self._sem = asyncio.Semaphore(self.concurrency)
+        return self._session
+    
+    async def _fetch(self, url: str, params: Optional[Dict],
+                     headers: Optional[Dict]) -> Tuple[int, bytes]:
+        response = await self._session.get(url, params=params, headers=headers)
+        return response.status_code, response.content
+    
+    def _get_history_db(self) -> Optional[PriceHistoryDB]:
+        if not self._history_db_opened:
+            self.history_db = open_history_db()
+            self._history_db_opened = True
+        return self.history_db
+    
+    async def close(self):
+        if self._session is not None and not self._session.is_closed:
+            await self._session.aclose()
+        self._session = None
+    
+    def _headers(self) -> Dict:
+        headers = {}
+        if self.api_key:
+            headers['x-cg-demo-api-key'] = self.api_key
+            headers['x-cg-demo-api-label'] = 'nagiteja'
+        return headers
         
+    @staticmethod
+    def _price_key(symbols: List[str]) -> str:
+        return f"cg:price:{','.join(sorted(symbol.lower() for symbol in symbols))}"
+    
     async def get_stablecoin_prices(self, symbols: List[str]) -> Dict:
         """Fetch current prices for stablecoins"""
+        # No last-good fallback here: a stale price must not hide the Binance fallback
+        return await self.cache.get_or_set(
+            self._price_key(symbols), CACHE_TTLS['price'], lambda: self._fetch_stablecoin_prices(symbols)
+        )
+    
+    async def get_last_good_prices(self, symbols: List[str]) -> Dict:
+        """Return the last prices CoinGecko answered with, however old, or {}"""
+        return await self.cache.get_last_good(self._price_key(symbols)) or {}
+    
+    @timed(COLLECTOR_LATENCY.labels('coingecko', 'simple/price'))
+    async def _fetch_stablecoin_prices(self, symbols: List[str]) -> Dict:
         try:
-            async with self.throttler:
-                async with aiohttp.ClientSession() as session:
-                    # Get price data for all stablecoins
-                    ids = ','.join([f"{symbol.lower()}" for symbol in symbols])
-                    url = f"{self.base_url}/simple/price"
-                    params = {
-                        'ids': ids,
-                        'vs_currencies': 'usd',
-                        'include_24hr_change': 'true',
-                        'include_market_cap': 'true'
-                    }
-                    
-                    headers = {}
-                    if self.api_key:
-                        headers['x-cg-demo-api-key'] = self.api_key
-                        headers['x-cg-demo-api-label'] = 'nagiteja'
-                    
-                    async with session.get(url, params=params, headers=headers) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            return data
-                        else:
-                            logger.error(f"CoinGecko API error: {response.status}")
-                            return {}
+            # Get price data for all stablecoins
+            ids = ','.join([f"{symbol.lower()}" for symbol in symbols])
+            url = f"{self.base_url}/simple/price"
+            params = {
+                'ids': ids,
+                'vs_currencies': 'usd',
+                'include_24hr_change': 'true',
+                'include_market_cap': 'true'
+            }
+            
+            status, data = await self._get_json(url, params=params, headers=self._headers())
+            if data is not None:
+                return data
+            else:
+                logger.error(f"CoinGecko API error: {status}")
+                return {}
         except Exception as e:
             logger.error(f"Error fetching CoinGecko data: {e}")
             return {}
     
     async def get_historical_prices(self, symbol: str, days: int = 30) -> pd.DataFrame:
         """Fetch historical price data for a stablecoin"""
+        if self._get_history_db() is not None:
+            await self._sync_history(symbol, days)
+            df = await asyncio.to_thread(self.history_db.read, symbol, days)
+        else:
+            # Only the raw [timestamp, price] pairs are cached; the DataFrame is rebuilt per call
+            key = f"cg:hist:{symbol.lower()}:{days}"
+            prices = await self.cache.get_or_set(
+                key, CACHE_TTLS['historical'], lambda: self._fetch_historical_prices(symbol, days),
+                breaker=self.breaker
+            )
+            df = pd.DataFrame(prices, columns=['timestamp', 'price'])
+            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
+        if df.empty:
+            return pd.DataFrame()
+        
+        df['date'] = df['timestamp'].dt.date
+        df['symbol'] = symbol.upper()
+        return df
+    
+    async def _sync_history(self, symbol: str, days: int):
+        """Download only the points newer than what the history database already holds"""
+        now = int(time.time())
+        # DuckDB calls block, so they run on a worker thread (the DB serializes them itself)
+        last_ms = await asyncio.to_thread(self.history_db.last_timestamp, symbol)
+        if last_ms is None or last_ms // 1000 < now - days * 86400:
+            prices = await self._fetch_historical_prices(symbol, days)
+        elif now - last_ms // 1000 < 300:
+            # CoinGecko has nothing finer than 5-minute points to offer yet
+            return
+        else:
+            prices = await self._fetch_historical_range(symbol, last_ms // 1000, now)
+        await asyncio.to_thread(self.history_db.insert, symbol, prices)
+    
+    @timed(COLLECTOR_LATENCY.labels('coingecko', 'market_chart/range'))
+    async def _fetch_historical_range(self, symbol: str, start: int, end: int) -> List:
         try:
-            async with self.throttler:
-                async with aiohttp.ClientSession() as session:
-                    url = f"{self.base_url}/coins/{symbol.lower()}/market_chart"
-                    params = {
-                        'vs_currency': 'usd',
-                        'days': days
-                    }
-                    
-                    headers = {}
-                    if self.api_key:
-                        headers['x-cg-demo-api-key'] = self.api_key
-                        headers['x-cg-demo-api-label'] = 'nagiteja'
-                    
-                    async with session.get(url, params=params, headers=headers) as response:
-                        if response.status == 200:
-                            data = await response.json()
-                            
-                            # Convert to DataFrame
-                            prices = data.get('prices', [])
-                            df = pd.DataFrame(prices, columns=['timestamp', 'price'])
-                            df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-                            df['date'] = df['timestamp'].dt.date
-                            df['symbol'] = symbol.upper()
-                            
-                            return df
-                        else:
-                            logger.error(f"CoinGecko historical API error: {response.status}")
-                            return pd.DataFrame()
+            url = f"{self.base_url}/coins/{symbol.lower()}/market_chart/range"
+            params = {
+                'vs_currency': 'usd',
+                'from': start,
+                'to': end
+            }
+            
+            status, data = await self._get_json(url, params=params, headers=self._headers())
+            if data is not None:
+                return data.get('prices', [])
+            else:
+                logger.error(f"CoinGecko historical range API error: {status}")
+                return []
+        except Exception as e:
+            logger.error(f"Error fetching historical range for {symbol}: {e}")
+            return []
+    
+    @timed(COLLECTOR_LATENCY.labels('coingecko', 'market_chart'))
+    async def _fetch_historical_prices(self, symbol: str, days: int) -> List:
+        try:
+            url = f"{self.base_url}/coins/{symbol.lower()}/market_chart"
+            params = {
+                'vs_currency': 'usd',
+                'days': days
+            }
+            
+            status, data = await self._get_json(url, params=params, headers=self._headers())
+            if data is not None:
+                return data.get('prices', [])
+            else:
+                logger.error(f"CoinGecko historical API error: {status}")
+                return []
         except Exception as e:
             logger.error(f"Error fetching historical data for {symbol}: {e}")
-            return pd.DataFrame()
+            return []
 
-class BinanceCollector:
+class BinanceCollector(HTTPCollector):
     """Collects stablecoin price data from Binance API (free, no key required)"""
     
     def __init__(self):
+        super().__init__()
         self.base_url = "https://api.binance.com/api/v3"
         
+    @timed(COLLECTOR_LATENCY.labels('binance', 'ticker/price'))
     async def get_stablecoin_prices(self, symbols: List[str]) -> Dict:
         """Fetch current prices for stablecoins from Binance"""
         try:
-            async with aiohttp.ClientSession() as session:
-                result = {}
-                for symbol in symbols:
-                    try:
-                        # Binance uses USDT as quote currency
-                        if symbol.upper() != 'USDT':
-                            ticker = f"{symbol.upper()}USDT"
-                            url = f"{self.base_url}/ticker/price"
-                            params = {'symbol': ticker}
-                            
-                            async with session.get(url, params=params) as response:
-                                if response.status == 200:
-                                    data = await response.json()
-                                    result[symbol.lower()] = {
-                                        'usd': float(data['price']),
-                                        'usd_market_cap': 0,  # Binance doesn't provide market cap
-                                        'usd_24h_change': 0   # Would need 24h ticker for this
-                                    }
-                        else:
-                            # USDT is always $1.00
-                            result['usdt'] = {
-                                'usd': 1.0,
-                                'usd_market_cap': 0,
-                                'usd_24h_change': 0
-                            }
-                    except Exception as e:
-                        logger.error(f"Error fetching Binance data for {symbol}: {e}")
-                        continue
+            result = {}
+            for symbol in symbols:
+                try:
+                    # Binance uses USDT as quote currency
+                    if symbol.upper() != 'USDT':
+                        ticker = f"{symbol.upper()}USDT"
+                        url = f"{self.base_url}/ticker/price"
+                        params = {'symbol': ticker}
                         
-                return result
+                        _, data = await self._get_json(url, params=params)
+                        if data is not None:
+                            result[symbol.lower()] = {
+                                'usd': float(data['price']),
+                                'usd_market_cap': 0,  # Binance doesn't provide market cap
+                                'usd_24h_change': 0   # Would need 24h ticker for this
+                            }
+                    else:
+                        # USDT is always $1.00
+                        result['usdt'] = {
+                            'usd': 1.0,
+                            'usd_market_cap': 0,
+                            'usd_24h_change': 0
+                        }
+                except Exception as e:
+                    logger.error(f"Error fetching Binance data for {symbol}: {e}")
+                    continue
+                    
+            return result
         except Exception as e:
             logger.error(f"Error in Binance collector: {e}")
             return {}
 
-class DeFiLlamaCollector:
+class DeFiLlamaCollector(HTTPCollector):
     """Collects DeFi protocol data and TVL information"""
     
     def __init__(self):
+        super().__init__()
         self.base_url = DEFILLAMA_BASE_URL
         
+    @timed(COLLECTOR_LATENCY.labels('defillama', 'protocol'))
     async def get_protocol_tvl(self, protocol: str) -> Dict:
         """Fetch TVL data for a specific protocol"""
         try:
-            async with aiohttp.ClientSession() as session:
-                url = f"{self.base_url}/protocol/{protocol}"
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return data
-                    else:
-                        logger.error(f"DeFiLlama API error: {response.status}")
-                        return {}
+            url = f"{self.base_url}/protocol/{protocol}"
+            status, data = await self._get_json(url)
+            if data is not None:
+                return data
+            else:
+                logger.error(f"DeFiLlama API error: {status}")
+                return {}
         except Exception as e:
             logger.error(f"Error fetching DeFiLlama data: {e}")
             return {}
     
+    @timed(COLLECTOR_LATENCY.labels('defillama', 'historicalChainTvls'))
     async def get_stablecoin_tvl(self) -> Dict:
         """Fetch stablecoin TVL data"""
         try:
-            async with aiohttp.ClientSession() as session:
-                url = f"{self.base_url}/v2/historicalChainTvls/Ethereum"
-                async with session.get(url) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        return data
-                    else:
-                        logger.error(f"DeFiLlama TVL API error: {response.status}")
-                        return {}
+            url = f"{self.base_url}/v2/historicalChainTvls/Ethereum"
+            status, data = await self._get_json(url)
+            if data is not None:
+                return data
+            else:
+                logger.error(f"DeFiLlama TVL API error: {status}")
+                return {}
         except Exception as e:
             logger.error(f"Error fetching TVL data: {e}")
             return {}
 
-class EtherscanCollector:
+class EtherscanCollector(HTTPCollector):
     """Collects on-chain data from Etherscan API"""
     
     def __init__(self):
+        super().__init__()
         self.base_url = ETHERSCAN_BASE_URL
         self.api_key = ETHERSCAN_API_KEY
+        self.cache = response_cache
+        self.holder_estimates = {
+            config['address']: config['holders_estimate'] for config in STABLECOINS.values()
+        }
         
-    def get_token_supply(self, contract_address: str) -> Optional[int]:
+    async def get_token_supply(self, contract_address: str) -> Optional[int]:
         """Get current token supply from Etherscan"""
+        return await self.cache.get_or_set(
+            f"etherscan:supply:{contract_address}", CACHE_TTLS['supply'],
+            lambda: self._fetch_token_supply(contract_address), breaker=self.breaker
+        )
+    
+    @timed(COLLECTOR_LATENCY.labels('etherscan', 'tokensupply'))
+    async def _fetch_token_supply(self, contract_address: str) -> Optional[int]:
         try:
             url = f"{self.base_url}"
             params = {
@@ -189,42 +362,47 @@ class EtherscanCollector:
                 'apikey': self.api_key
             }
             
-            response = requests.get(url, params=params)
-            if response.status_code == 200:
-                data = response.json()
-                if data['status'] == '1':
-                    return int(data['result'])
-                else:
-                    logger.error(f"Etherscan API error: {data['message']}")
-                    return None
+            status, data = await self._get_json(url, params=params)
+            if data is None:
+                logger.error(f"Etherscan HTTP error: {status}")
+                return None
+            if data['status'] == '1':
+                return int(data['result'])
             else:
-                logger.error(f"Etherscan HTTP error: {response.status_code}")
+                logger.error(f"Etherscan API error: {data['message']}")
                 return None
         except Exception as e:
             logger.error(f"Error fetching token supply: {e}")
             return None
     
-    def get_token_holders(self, contract_address: str) -> Optional[int]:
+    async def get_token_holders(self, contract_address: str) -> Optional[int]:
         """Get number of token holders"""
+        if not ETHERSCAN_PRO:
+            return self.holder_estimates.get(contract_address)
+        return await self.cache.get_or_set(
+            f"etherscan:holders:{contract_address}", CACHE_TTLS['holders'],
+            lambda: self._fetch_token_holders(contract_address), breaker=self.breaker
+        )
+    
+    @timed(COLLECTOR_LATENCY.labels('etherscan', 'tokenholdercount'))
+    async def _fetch_token_holders(self, contract_address: str) -> Optional[int]:
         try:
             url = f"{self.base_url}"
             params = {
                 'module': 'token',
-                'action': 'tokenholderlist',
+                'action': 'tokenholdercount',
                 'contractaddress': contract_address,
                 'apikey': self.api_key
             }
             
-            response = requests.get(url, params=params)
-            if response.status_code == 200:
-                data = response.json()
-                if data['status'] == '1':
-                    return len(data['result'])
-                else:
-                    logger.error(f"Etherscan API error: {data['message']}")
-                    return None
+            status, data = await self._get_json(url, params=params)
+            if data is None:
+                logger.error(f"Etherscan HTTP error: {status}")
+                return None
+            if data['status'] == '1':
+                return int(data['result'])
             else:
-                logger.error(f"Etherscan HTTP error: {response.status_code}")
+                logger.error(f"Etherscan API error: {data['message']}")
                 return None
         except Exception as e:
             logger.error(f"Error fetching token holders: {e}")
@@ -238,6 +416,7 @@ class DataAggregator:
         self.binance = BinanceCollector()
         self.defillama = DeFiLlamaCollector()
         self.etherscan = EtherscanCollector()
+        self.history: Dict[str, HistorySeries] = {}
         
     async def collect_all_data(self) -> Dict:
         """Collect comprehensive data for all stablecoins"""
@@ -246,17 +425,30 @@ class DataAggregator:
             symbols = list(STABLECOINS.keys())
             prices = await self.coingecko.get_stablecoin_prices(symbols)
             
+            prices_stale = False
+            
             # If CoinGecko fails, try Binance
             if not prices or not any(prices.values()):
                 logger.info("CoinGecko failed, trying Binance API...")
                 prices = await self.binance.get_stablecoin_prices(symbols)
             
-            # Collect on-chain data
+            # Only when both are down, show the last CoinGecko prices marked as stale
+            if not prices or not any(prices.values()):
+                prices = await self.coingecko.get_last_good_prices(symbols)
+                prices_stale = bool(prices)
+                if prices_stale:
+                    logger.warning("All price sources failed, serving last good CoinGecko prices")
+            
+            # Collect on-chain data for every stablecoin concurrently
+            results = await asyncio.gather(*[
+                asyncio.gather(
+                    self.etherscan.get_token_supply(config['address']),
+                    self.etherscan.get_token_holders(config['address'])
+                )
+                for config in STABLECOINS.values()
+            ])
             on_chain_data = {}
-            for symbol, config in STABLECOINS.items():
-                supply = self.etherscan.get_token_supply(config['address'])
-                holders = self.etherscan.get_token_holders(config['address'])
-                
+            for (symbol, config), (supply, holders) in zip(STABLECOINS.items(), results):
                 on_chain_data[symbol] = {
                     'supply': supply,
                     'holders': holders,
@@ -268,7 +460,12 @@ class DataAggregator:
                 'timestamp': datetime.now().isoformat(),
                 'prices': prices,
                 'on_chain': on_chain_data,
-                'stablecoins': STABLECOINS
+                'stablecoins': STABLECOINS,
+                # Sections that may hold last-good values instead of fresh ones
+                'stale': {
+                    'prices': prices_stale,
+                    'on_chain': self.etherscan.breaker.state == 'open'
+                }
             }
             
             return aggregated_data
@@ -276,21 +473,43 @@ class DataAggregator:
             logger.error(f"Error aggregating data: {e}")
             return {}
     
-    async def get_historical_data(self, symbol: str, days: int = 30) -> pd.DataFrame:
-        """Get historical data for a specific stablecoin"""
-        return await self.coingecko.get_historical_prices(symbol, days)
+    async def close(self):
+        """Release the HTTP sessions held by every collector"""
+        await asyncio.gather(
+            self.coingecko.close(),
+            self.binance.close(),
+            self.defillama.close(),
+            self.etherscan.close()
+        )
+    
+    async def get_historical_data(self, symbol: str, days: int = 30) -> HistorySeries:
+        """Get historical data for a specific stablecoin, appending only unseen points"""
+        df = await self.coingecko.get_historical_prices(symbol, days)
+        # Hourly points, endpoints included, trimmed to the same `days` span as the fetch
+        series = self.history.get(symbol)
+        if series is None:
+            series = self.history[symbol] = HistorySeries(
+                capacity=days * 24 + 1, window=np.timedelta64(days, 'D')
+            )
+        if not df.empty:
+            series.append(df['timestamp'].to_numpy(), df['price'].to_numpy())
+        return series
     
     def calculate_peg_deviation(self, current_price: float, target_price: float = 1.0) -> float:
         """Calculate deviation from peg"""
         return abs(current_price - target_price) / target_price
     
-    def detect_anomalies(self, prices: List[float], threshold: float = 0.02) -> List[bool]:
+    @staticmethod
+    def detect_anomalies(prices: Union[List[float], np.ndarray], threshold: float = 0.02) -> np.ndarray:
         """Detect price anomalies based on threshold"""
         target_price = 1.0
-        anomalies = []
-        
-        for price in prices:
-            deviation = self.calculate_peg_deviation(price, target_price)
-            anomalies.append(deviation > threshold)
-        
-        return anomalies
+        arr = np.asarray(prices, dtype=np.float64)
+        return np.abs(arr - target_price) / target_price > threshold
+    
+    @staticmethod
+    def detect_zscore_anomalies(prices: Union[List[float], np.ndarray],
+                                window: int = ZSCORE_WINDOW, k: float = ZSCORE_K) -> Tuple[np.ndarray, np.ndarray]:
+        """Detect anomalies against the rolling mean; returns (mask, z-score)"""
+        # Imported here so numba only loads in processes that enable this detector
+        from anomaly import rolling_zscore
+        return rolling_zscore(prices, window, k)
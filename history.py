@@ -0,0 +1,76 @@
+import threading
+from typing import Optional, Tuple
+
+import numpy as np
+
+class HistorySeries:
+    """Fixed-window price series that appends new points in place
+
+    Points live in preallocated arrays twice the window size. Appends only write
+    past `head`, and once the arrays are full the newest `capacity` points are
+    compacted into fresh arrays, so views handed out by `view()` can be read
+    without copying. The one exception is the newest point: a point with the same
+    timestamp revises its price in place, since the newest hourly bucket keeps
+    changing until the hour is over.
+
+    With `window` set, `view()` also drops points older than `window` before the
+    newest one, so gaps in the data can't stretch the series past its time span.
+    """
+
+    def __init__(self, capacity: int = 1024, window: Optional[np.timedelta64] = None):
+        self.capacity = capacity
+        self.window = window
+        self.ts = np.empty(2 * capacity, dtype='datetime64[s]')
+        self.px = np.empty(2 * capacity, dtype='f8')
+        self.head = 0
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.view()[0])
+
+    def append(self, new_ts, new_px) -> int:
+        """Append points newer than the last stored timestamp, revising the last one
+
+        Returns how many points were added or revised.
+        """
+        new_ts = np.asarray(new_ts, dtype='datetime64[s]')
+        new_px = np.asarray(new_px, dtype='f8')
+
+        with self._lock:
+            revised = 0
+            if self.head:
+                last = self.ts[self.head - 1]
+                same = new_ts == last
+                if same.any() and new_px[same][-1] != self.px[self.head - 1]:
+                    self.px[self.head - 1] = new_px[same][-1]
+                    revised = 1
+                newer = new_ts > last
+                new_ts, new_px = new_ts[newer], new_px[newer]
+            count = len(new_ts)
+            if count == 0:
+                return revised
+            if count > self.capacity:
+                new_ts, new_px = new_ts[-self.capacity:], new_px[-self.capacity:]
+
+            if self.head + len(new_ts) > len(self.ts):
+                keep = self.capacity - len(new_ts)
+                ts = np.empty_like(self.ts)
+                px = np.empty_like(self.px)
+                ts[:keep] = self.ts[self.head - keep:self.head]
+                px[:keep] = self.px[self.head - keep:self.head]
+                self.ts, self.px, self.head = ts, px, keep
+
+            end = self.head + len(new_ts)
+            self.ts[self.head:end] = new_ts
+            self.px[self.head:end] = new_px
+            self.head = end
+            return count + revised
+
+    def view(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (timestamps, prices) for the current window without copying"""
+        with self._lock:
+            start = max(0, self.head - self.capacity)
+            if self.window is not None and self.head:
+                oldest = self.ts[self.head - 1] - self.window
+                start += int(np.searchsorted(self.ts[start:self.head], oldest))
+            return self.ts[start:self.head], self.px[start:self.head]
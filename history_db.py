@@ -0,0 +1,72 @@
+import logging
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional
+
+import duckdb
+import numpy as np
+import pandas as pd
+
+from config import HISTORY_DB_PATH
+
+logger = logging.getLogger(__name__)
+
+class PriceHistoryDB:
+    """Historical prices persisted in DuckDB so only new points are downloaded"""
+
+    def __init__(self, path: str = HISTORY_DB_PATH):
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._con = duckdb.connect(path)
+        self._lock = threading.Lock()
+        self._con.execute("""
+            CREATE TABLE IF NOT EXISTS prices(
+                symbol VARCHAR, ts TIMESTAMP, price DOUBLE, PRIMARY KEY(symbol, ts)
+            )
+        """)
+
+    def last_timestamp(self, symbol: str) -> Optional[int]:
+        """Return the newest stored timestamp for `symbol` in epoch ms, or None"""
+        with self._lock:
+            row = self._con.execute(
+                "SELECT epoch_ms(max(ts)) FROM prices WHERE symbol = ?", [symbol]
+            ).fetchone()
+        return row[0]
+
+    def insert(self, symbol: str, prices: List) -> None:
+        """Store CoinGecko [epoch ms, price] pairs, ignoring points already present"""
+        if not prices:
+            return
+        arr = np.asarray(prices, dtype='f8')
+        batch = pd.DataFrame({
+            'ts': arr[:, 0].astype('int64').astype('datetime64[ms]'),
+            'price': arr[:, 1]
+        })
+        with self._lock:
+            self._con.register('batch', batch)
+            try:
+                self._con.execute(
+                    "INSERT OR IGNORE INTO prices SELECT ?, ts, price FROM batch", [symbol]
+                )
+            finally:
+                self._con.unregister('batch')
+
+    def read(self, symbol: str, days: int) -> pd.DataFrame:
+        """Return hourly (timestamp, price) rows for the last `days` days"""
+        since = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=days)
+        # Recent range fetches come back at 5-minute granularity; keep the chart hourly
+        with self._lock:
+            return self._con.execute("""
+                SELECT date_trunc('hour', ts) AS timestamp, arg_max(price, ts) AS price
+                FROM prices WHERE symbol = ? AND ts >= ?
+                GROUP BY 1 ORDER BY 1
+            """, [symbol, since]).fetch_df()
+
+def open_history_db(path: str = HISTORY_DB_PATH) -> Optional[PriceHistoryDB]:
+    """Open the history database, or return None if another process holds it"""
+    try:
+        return PriceHistoryDB(path)
+    except (duckdb.Error, OSError) as e:
+        logger.warning(f"History database unavailable, refetching full history instead: {e}")
+        return None
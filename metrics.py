@@ -0,0 +1,31 @@
+import asyncio
+import functools
+
+from prometheus_client import Histogram
+
+COLLECTOR_LATENCY = Histogram(
+    'collector_seconds', 'Time spent fetching from an upstream API', ['provider', 'endpoint']
+)
+CALLBACK_LATENCY = Histogram(
+    'callback_seconds', 'Time spent in a Dash callback', ['callback']
+)
+
+def timed(metric):
+    """Observe the wall time of each call on `metric`, awaiting coroutines to completion"""
+    def decorator(func):
+        if asyncio.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def wrapper(*args, **kwargs):
+                with metric.time():
+                    return await func(*args, **kwargs)
+        else:
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with metric.time():
+                    return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def timed_callback(func):
+    """Time a Dash callback under its function name"""
+    return timed(CALLBACK_LATENCY.labels(func.__name__))(func)
@@ -38,26 +38,30 @@ def run_data_collector():
     
     async def collect_data():
         aggregator = DataAggregator()
-        while True:
-            try:
-                print("📊 Collecting stablecoin data...")
-                data = await aggregator.collect_all_data()
-                if data:
-                    print(f"✅ Data collected at {data.get('timestamp', 'unknown')}")
-                else:
-                    print("❌ Failed to collect data")
+        try:
+            while True:
+                try:
+                    print("📊 Collecting stablecoin data...")
+                    data, *hist_results = await asyncio.gather(
+                        aggregator.collect_all_data(),
+                        *[aggregator.get_historical_data(symbol) for symbol in STABLECOINS.keys()]
+                    )
+                    if data:
+                        print(f"✅ Data collected at {data.get('timestamp', 'unknown')}")
+                    else:
+                        print("❌ Failed to collect data")
                 
-                # Collect historical data
-                for symbol in STABLECOINS.keys():
-                    hist_data = await aggregator.get_historical_data(symbol)
-                    if not hist_data.empty:
-                        print(f"📈 Historical data collected for {symbol}")
+                    for symbol, series in zip(STABLECOINS.keys(), hist_results):
+                        if len(series):
+                            print(f"📈 Historical data collected for {symbol}")
                 
-            except Exception as e:
-                print(f"❌ Error in data collection: {e}")
+                except Exception as e:
+                    print(f"❌ Error in data collection: {e}")
             
-            print(f"⏳ Waiting 5 minutes before next update...")
-            await asyncio.sleep(300)  # 5 minutes
+                print(f"⏳ Waiting 5 minutes before next update...")
+                await asyncio.sleep(300)  # 5 minutes
+        finally:
+            await aggregator.close()
     
     loop = asyncio.new_event_loop()
     asyncio.set_event_loop(loop)
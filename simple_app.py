@@ -4,6 +4,7 @@ import dash_bootstrap_components as dbc
 import plotly.graph_objs as go
 import plotly.express as px
 from datetime import datetime
+import numpy as np
 import pandas as pd
 
 # Initialize the Dash app
@@ -41,18 +42,94 @@ sample_data = {
     }
 }
 
+# Sample chart dates, built once and shared by every symbol's frame
+_CHART_DATES = pd.date_range(start='2024-08-01', end='2024-09-02', freq='D')
+
 # Create sample historical data
 def create_sample_chart_data():
-    dates = pd.date_range(start='2024-08-01', end='2024-09-02', freq='D')
+    dates = _CHART_DATES
+    # Alternating +/- offsets that grow by 0.001 per day, shared by every symbol
+    i = np.arange(len(dates), dtype=np.float64)
+    offsets = 0.001 * i * (1 - 2 * (i % 2))
     data = {}
     for symbol in ['USDT', 'USDC', 'DAI']:
         base_price = 1.0 if symbol != 'DAI' else 0.999
-        prices = [base_price + (i * 0.001 * (1 if i % 2 == 0 else -1)) for i in range(len(dates))]
-        data[symbol] = pd.DataFrame({'date': dates, 'price': prices})
+        data[symbol] = pd.DataFrame({'date': dates, 'price': base_price + offsets})
     return data
 
 chart_data = create_sample_chart_data()
 
+SYMBOLS = ('USDT', 'USDC', 'DAI')
+
+# The sample data is constant, so every display string is formatted once here
+DISPLAY_FORMATS = {
+    'price': lambda x: f"${x:.3f}",
+    'change_24h': lambda x: f"{x:+.2%}",
+    'market_cap': lambda x: f"${x/1e9:.1f}B",
+    'supply': lambda x: f"{x/1e9:.1f}B",
+    'holders': lambda x: f"{x/1e6:.1f}M"
+}
+disp = {
+    f"{symbol}_{key}": fmt(values[key])
+    for symbol, values in sample_data.items()
+    for key, fmt in DISPLAY_FORMATS.items()
+}
+for symbol, values in sample_data.items():
+    disp[f"{symbol}_status"] = values['status']
+    disp[f"{symbol}_color"] = 'success' if values['status'] == 'Stable' else 'warning'
+
+def make_card(symbol):
+    """Build the status card for one stablecoin"""
+    return dbc.Col([
+        dbc.Card([
+            dbc.CardBody([
+                html.H4(symbol, className="card-title"),
+                html.H2(disp[f"{symbol}_price"], className=f"text-{disp[f'{symbol}_color']}"),
+                html.P(f"24h: {disp[f'{symbol}_change_24h']}", className="mb-1"),
+                html.Small(f"Market Cap: {disp[f'{symbol}_market_cap']}", className="text-muted"),
+                html.Br(),
+                html.Small(f"Supply: {disp[f'{symbol}_supply']}", className="text-muted"),
+                html.Br(),
+                html.Small(f"Holders: {disp[f'{symbol}_holders']}", className="text-muted"),
+                html.Br(),
+                dbc.Badge(disp[f"{symbol}_status"], color=disp[f"{symbol}_color"], className="mt-2")
+            ])
+        ], className="h-100")
+    ], width=4)
+
+def make_table_row(symbol):
+    """Build the summary table row for one stablecoin"""
+    return html.Tr([
+        html.Td(symbol),
+        html.Td(disp[f"{symbol}_price"]),
+        html.Td(disp[f"{symbol}_change_24h"]),
+        html.Td(disp[f"{symbol}_market_cap"]),
+        html.Td(dbc.Badge(disp[f"{symbol}_status"], color=disp[f"{symbol}_color"]))
+    ])
+
+def make_price_trends_figure():
+    """Build the WebGL price trend chart for all stablecoins"""
+    fig = go.Figure(layout=go.Layout(
+        title="Stablecoin Price Trends",
+        xaxis={'title': 'Date'},
+        yaxis={'title': 'Price (USD)', 'range': [0.995, 1.005]},
+        hovermode='x unified',
+        showlegend=True
+    ))
+    # Pass ndarrays so Plotly skips converting each Series
+    fig.add_traces([
+        go.Scattergl(
+            x=chart_data[symbol]['date'].values,
+            y=chart_data[symbol]['price'].values,
+            mode='lines',
+            name=symbol,
+            line=dict(width=2)
+        ) for symbol in SYMBOLS
+    ])
+    return fig
+
+price_trends_figure = make_price_trends_figure()
+
 # Layout
 app.layout = dbc.Container([
     dbc.Row([
@@ -63,58 +140,7 @@ app.layout = dbc.Container([
     ]),
     
     # Status Cards
-    dbc.Row([
-        dbc.Col([
-            dbc.Card([
-                dbc.CardBody([
-                    html.H4("USDT", className="card-title"),
-                    html.H2(f"${sample_data['USDT']['price']:.3f}", className="text-success"),
-                    html.P(f"24h: {sample_data['USDT']['change_24h']:+.2%}", className="mb-1"),
-                    html.Small(f"Market Cap: ${sample_data['USDT']['market_cap']/1e9:.1f}B", className="text-muted"),
-                    html.Br(),
-                    html.Small(f"Supply: {sample_data['USDT']['supply']/1e9:.1f}B", className="text-muted"),
-                    html.Br(),
-                    html.Small(f"Holders: {sample_data['USDT']['holders']/1e6:.1f}M", className="text-muted"),
-                    html.Br(),
-                    dbc.Badge("Stable", color="success", className="mt-2")
-                ])
-            ], className="h-100")
-        ], width=4),
-        
-        dbc.Col([
-            dbc.Card([
-                dbc.CardBody([
-                    html.H4("USDC", className="card-title"),
-                    html.H2(f"${sample_data['USDC']['price']:.3f}", className="text-success"),
-                    html.P(f"24h: {sample_data['USDC']['change_24h']:+.2%}", className="mb-1"),
-                    html.Small(f"Market Cap: ${sample_data['USDC']['market_cap']/1e9:.1f}B", className="text-muted"),
-                    html.Br(),
-                    html.Small(f"Supply: {sample_data['USDC']['supply']/1e9:.1f}B", className="text-muted"),
-                    html.Br(),
-                    html.Small(f"Holders: {sample_data['USDC']['holders']/1e6:.1f}M", className="text-muted"),
-                    html.Br(),
-                    dbc.Badge("Stable", color="success", className="mt-2")
-                ])
-            ], className="h-100")
-        ], width=4),
-        
-        dbc.Col([
-            dbc.Card([
-                dbc.CardBody([
-                    html.H4("DAI", className="card-title"),
-                    html.H2(f"${sample_data['DAI']['price']:.3f}", className="text-warning"),
-                    html.P(f"24h: {sample_data['DAI']['change_24h']:+.2%}", className="mb-1"),
-                    html.Small(f"Market Cap: ${sample_data['DAI']['market_cap']/1e9:.1f}B", className="text-muted"),
-                    html.Br(),
-                    html.Small(f"Supply: {sample_data['DAI']['supply']/1e9:.1f}B", className="text-muted"),
-                    html.Br(),
-                    html.Small(f"Holders: {sample_data['DAI']['holders']/1e6:.1f}M", className="text-muted"),
-                    html.Br(),
-                    dbc.Badge("Minor Deviation", color="warning", className="mt-2")
-                ])
-            ], className="h-100")
-        ], width=4)
-    ], className="mb-4"),
+    dbc.Row([make_card(symbol) for symbol in SYMBOLS], className="mb-4"),
     
     # Charts
     dbc.Row([
@@ -122,26 +148,7 @@ app.layout = dbc.Container([
             dbc.Card([
                 dbc.CardHeader("Price History (Last 30 Days)"),
                 dbc.CardBody([
-                    dcc.Graph(
-                        figure={
-                            'data': [
-                                go.Scatter(
-                                    x=chart_data[symbol]['date'],
-                                    y=chart_data[symbol]['price'],
-                                    mode='lines',
-                                    name=symbol,
-                                    line=dict(width=2)
-                                ) for symbol in ['USDT', 'USDC', 'DAI']
-                            ],
-                            'layout': go.Layout(
-                                title="Stablecoin Price Trends",
-                                xaxis={'title': 'Date'},
-                                yaxis={'title': 'Price (USD)', 'range': [0.995, 1.005]},
-                                hovermode='x unified',
-                                showlegend=True
-                            )
-                        }
-                    )
+                    dcc.Graph(figure=price_trends_figure)
                 ])
             ])
         ], width=12)
@@ -163,29 +170,7 @@ app.layout = dbc.Container([
                                 html.Th("Status")
                             ])
                         ]),
-                        html.Tbody([
-                            html.Tr([
-                                html.Td("USDT"),
-                                html.Td(f"${sample_data['USDT']['price']:.3f}"),
-                                html.Td(f"{sample_data['USDT']['change_24h']:+.2%}"),
-                                html.Td(f"${sample_data['USDT']['market_cap']/1e9:.1f}B"),
-                                html.Td(dbc.Badge("Stable", color="success"))
-                            ]),
-                            html.Tr([
-                                html.Td("USDC"),
-                                html.Td(f"${sample_data['USDC']['price']:.3f}"),
-                                html.Td(f"{sample_data['USDC']['change_24h']:+.2%}"),
-                                html.Td(f"${sample_data['USDC']['market_cap']/1e9:.1f}B"),
-                                html.Td(dbc.Badge("Stable", color="success"))
-                            ]),
-                            html.Tr([
-                                html.Td("DAI"),
-                                html.Td(f"${sample_data['DAI']['price']:.3f}"),
-                                html.Td(f"{sample_data['DAI']['change_24h']:+.2%}"),
-                                html.Td(f"${sample_data['DAI']['market_cap']/1e9:.1f}B"),
-                                html.Td(dbc.Badge("Minor Deviation", color="warning"))
-                            ])
-                        ])
+                        html.Tbody([make_table_row(symbol) for symbol in SYMBOLS])
                     ], className="table table-striped")
                 ])
             ])
@@ -0,0 +1,108 @@
+import threading
+from typing import Dict, Optional, Tuple
+
+import numpy as np
+import orjson
+import pyarrow as pa
+import redis
+
+from config import REDIS_URL
+from history import HistorySeries
+
+def empty_history() -> Tuple[np.ndarray, np.ndarray]:
+    return np.empty(0, dtype='datetime64[s]'), np.empty(0, dtype='f8')
+
+class MemoryStore:
+    """Snapshot store shared between threads of a single process"""
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._epoch = 0
+        self._snapshot: Optional[str] = None
+        self._history: Dict[str, HistorySeries] = {}
+
+    def put_snapshot(self, snapshot: dict) -> int:
+        """Store the latest snapshot and wake anyone waiting for it"""
+        with self._cond:
+            self._snapshot = orjson.dumps(snapshot).decode()
+            self._epoch += 1
+            self._cond.notify_all()
+            return self._epoch
+
+    def get_snapshot(self) -> Optional[str]:
+        """Return the latest snapshot as a JSON string"""
+        return self._snapshot
+
+    def put_history(self, symbol: str, series: HistorySeries):
+        self._history[symbol] = series
+
+    def get_history(self, symbol: str) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (timestamps, prices) views of the symbol's series"""
+        series = self._history.get(symbol)
+        return series.view() if series is not None else empty_history()
+
+    def wait_for_update(self, after_epoch: int, timeout: Optional[float] = None) -> int:
+        """Block until the epoch moves past `after_epoch` or timeout; returns the epoch"""
+        with self._cond:
+            self._cond.wait_for(lambda: self._epoch > after_epoch, timeout=timeout)
+            return self._epoch
+
+class RedisStore:
+    """Snapshot store in Redis so one collector can feed many dashboard workers
+
+    Keys:
+        dash:current      latest snapshot as JSON
+        dash:hist:{sym}   historical prices as an Arrow IPC record batch
+        dash:epoch        counter bumped on every snapshot, announced on dash:updates
+    """
+
+    CHANNEL = 'dash:updates'
+
+    def __init__(self, url: str):
+        self._client = redis.Redis.from_url(url)
+        self._pubsub = None
+
+    def put_snapshot(self, snapshot: dict) -> int:
+        self._client.set('dash:current', orjson.dumps(snapshot))
+        epoch = self._client.incr('dash:epoch')
+        self._client.publish(self.CHANNEL, epoch)
+        return epoch
+
+    def get_snapshot(self) -> Optional[str]:
+        value = self._client.get('dash:current')
+        return value.decode() if value is not None else None
+
+    def put_history(self, symbol: str, series: HistorySeries):
+        ts, px = series.view()
+        batch = pa.record_batch([pa.array(ts), pa.array(px)], names=['timestamp', 'price'])
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, batch.schema) as writer:
+            writer.write_batch(batch)
+        self._client.set(f'dash:hist:{symbol}', sink.getvalue().to_pybytes())
+
+    def get_history(self, symbol: str) -> Tuple[np.ndarray, np.ndarray]:
+        value = self._client.get(f'dash:hist:{symbol}')
+        if value is None:
+            return empty_history()
+        batch = pa.ipc.open_stream(value).read_next_batch()
+        return batch.column(0).to_numpy(), batch.column(1).to_numpy()
+
+    def get_epoch(self) -> int:
+        return int(self._client.get('dash:epoch') or 0)
+
+    def wait_for_update(self, after_epoch: int, timeout: Optional[float] = None) -> int:
+        if self._pubsub is None:
+            # Subscribe before reading the epoch so no announcement is missed
+            self._pubsub = self._client.pubsub(ignore_subscribe_messages=True)
+            self._pubsub.subscribe(self.CHANNEL)
+        epoch = self.get_epoch()
+        if epoch <= after_epoch:
+            self._pubsub.get_message(timeout=timeout)
+            epoch = self.get_epoch()
+        return epoch
+
+def create_store():
+    """Use Redis when REDIS_URL is configured, otherwise keep state in-process"""
+    return RedisStore(REDIS_URL) if REDIS_URL else MemoryStore()
+
+snapshot_store = create_store()
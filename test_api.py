@@ -54,6 +54,8 @@ async def test_apis():
             print("❌ Data Aggregator failed")
     except Exception as e:
         print(f"❌ Data Aggregator error: {e}")
+    
+    await aggregator.close()
 
 if __name__ == "__main__":
     asyncio.run(test_apis())
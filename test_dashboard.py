@@ -5,45 +5,38 @@ Run this to verify all components are working correctly
 """
 
 import asyncio
+import importlib
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add the current directory to Python path
 sys.path.insert(0, str(Path(__file__).parent))
 
-def test_imports():
-    """Test if all required packages can be imported"""
-    print("🧪 Testing package imports...")
-    
-    try:
-        import dash
-        print("✅ Dash imported successfully")
-    except ImportError as e:
-        print(f"❌ Dash import failed: {e}")
-        return False
-    
-    try:
-        import plotly
-        print("✅ Plotly imported successfully")
-    except ImportError as e:
-        print(f"❌ Plotly import failed: {e}")
-        return False
-    
-    try:
-        import pandas
-        print("✅ Pandas imported successfully")
-    except ImportError as e:
-        print(f"❌ Pandas import failed: {e}")
-        return False
-    
+# Module name -> name shown in the diagnostics
+REQUIRED_PACKAGES = {
+    'dash': 'Dash',
+    'plotly': 'Plotly',
+    'pandas': 'Pandas',
+    'aiohttp': 'aiohttp'
+}
+
+def _try_import(module, label):
+    """Import one package, printing whether it worked"""
     try:
-        import aiohttp
-        print("✅ aiohttp imported successfully")
+        importlib.import_module(module)
+        print(f"✅ {label} imported successfully")
+        return True
     except ImportError as e:
-        print(f"❌ aiohttp import failed: {e}")
+        print(f"❌ {label} import failed: {e}")
         return False
+
+def test_imports():
+    """Test if all required packages can be imported"""
+    print("🧪 Testing package imports...")
     
-    return True
+    failed = [module for module, label in REQUIRED_PACKAGES.items() if not _try_import(module, label)]
+    return not failed
 
 def test_config():
     """Test configuration loading"""
@@ -102,6 +95,127 @@ def test_dash_app():
         print(f"❌ Dash app test failed: {e}")
         return False
 
+def test_history_series():
+    """Test appends across the compaction boundary and revision of the newest point"""
+    print("\n📈 Testing history series...")
+    
+    try:
+        import numpy as np
+        from history import HistorySeries
+        
+        series = HistorySeries(capacity=4)
+        ts = np.arange('2024-01-01T00', '2024-01-01T09', dtype='datetime64[h]').astype('datetime64[s]')
+        px = np.linspace(1.0, 0.92, len(ts))
+        series.append(ts[:6], px[:6])
+        # 6 + 3 points overflow the 2 * capacity arrays and force a compaction
+        added = series.append(ts[4:], px[4:])
+        view_ts, view_px = series.view()
+        if added != 3 or len(view_ts) != 4 or not (view_ts == ts[-4:]).all() or not (view_px == px[-4:]).all():
+            print(f"❌ Compaction kept the wrong window: added={added}, view={view_ts}")
+            return False
+        print("✅ Compaction keeps the newest window")
+        
+        series.append(ts[-1:], [0.5])
+        if series.view()[1][-1] != 0.5 or len(series) != 4:
+            print("❌ Newest point was not revised")
+            return False
+        print("✅ Newest point revised in place")
+        
+        # 40 days of hourly points must still show only the last 30 days
+        now = np.datetime64('now', 'h').astype('datetime64[s]')
+        hourly = np.arange(now - np.timedelta64(40 * 24, 'h'), now + np.timedelta64(1, 'h'), np.timedelta64(1, 'h'))
+        window = HistorySeries(capacity=30 * 24 + 1, window=np.timedelta64(30, 'D'))
+        for start in range(0, len(hourly), 100):
+            window.append(hourly[start:start + 100], np.ones(len(hourly[start:start + 100])))
+        view_ts = window.view()[0]
+        if view_ts[0] != now - np.timedelta64(30, 'D') or view_ts[-1] != now:
+            print(f"❌ Window spans {view_ts[0]} to {view_ts[-1]}, expected the last 30 days")
+            return False
+        print("✅ Series keeps exactly the last 30 days")
+        
+        return True
+    except Exception as e:
+        print(f"❌ History series test failed: {e}")
+        return False
+
+def test_circuit_breaker():
+    """Test the breaker opens after fail_max failures and closes after a good trial"""
+    print("\n🔌 Testing circuit breaker...")
+    
+    try:
+        from breaker import CircuitBreaker, CircuitOpenError
+        
+        async def run():
+            breaker = CircuitBreaker('test', fail_max=2, reset_timeout=0.05)
+            for _ in range(2):
+                try:
+                    async with breaker.calling():
+                        raise ConnectionError("provider down")
+                except ConnectionError:
+                    pass
+            if breaker.state != 'open':
+                print(f"❌ Breaker is {breaker.state} after 2 failures")
+                return False
+            try:
+                async with breaker.calling():
+                    pass
+                print("❌ Open breaker let a call through")
+                return False
+            except CircuitOpenError:
+                print("✅ Breaker opens after fail_max failures")
+            
+            await asyncio.sleep(0.06)
+            passed = []
+            
+            async def trial(i):
+                try:
+                    async with breaker.calling():
+                        await asyncio.sleep(0.01)
+                        passed.append(i)
+                except CircuitOpenError:
+                    pass
+            
+            await asyncio.gather(*(trial(i) for i in range(3)))
+            if len(passed) != 1 or breaker.state != 'closed':
+                print(f"❌ Half-open let {len(passed)} calls through, state {breaker.state}")
+                return False
+            print("✅ Breaker closes after a single successful trial")
+            return True
+        
+        # Own loop on a worker thread, so this also works from inside main()'s loop
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            return pool.submit(asyncio.run, run()).result()
+    except Exception as e:
+        print(f"❌ Circuit breaker test failed: {e}")
+        return False
+
+def test_zscore_kernels():
+    """Test the numba and NumPy z-score kernels agree"""
+    print("\n🧮 Testing z-score kernels...")
+    
+    try:
+        import numpy as np
+        import anomaly
+        
+        if anomaly.njit is None:
+            print("⚠️ numba not installed, only the NumPy kernel is in use")
+            return True
+        
+        rng = np.random.default_rng(0)
+        prices = 1.0 + rng.normal(0, 0.001, 500)
+        prices[300] = 0.95
+        mask_nb, score_nb = anomaly._rolling_zscore_numba(prices, 60, 3.0)
+        mask_np, score_np = anomaly._rolling_zscore_numpy(prices, 60, 3.0)
+        if not (mask_nb == mask_np).all() or not np.allclose(score_nb, score_np):
+            print("❌ numba and NumPy z-scores differ")
+            return False
+        print(f"✅ Kernels agree ({int(mask_np.sum())} anomalies flagged)")
+        
+        return True
+    except Exception as e:
+        print(f"❌ Z-score kernel test failed: {e}")
+        return False
+
 async def main():
     """Run all tests"""
     print("🚀 Running Stablecoin Dashboard Tests")
@@ -111,6 +225,9 @@ async def main():
         ("Package Imports", test_imports),
         ("Configuration", test_config),
         ("Data Collectors", test_data_collectors),
+        ("History Series", test_history_series),
+        ("Circuit Breaker", test_circuit_breaker),
+        ("Z-Score Kernels", test_zscore_kernels),
         ("Dash App", test_dash_app)
     ]
     